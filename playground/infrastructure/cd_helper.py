@@ -94,6 +94,7 @@ class CDHelper:
 
         async with GRPCClient() as client:
             await get_statuses(client,
-                               examples)  # run examples code and wait until all are executed
+                               examples,
+                               client_factory=GRPCClient)  # run examples code and wait until all are executed
             tasks = [_populate_fields(example) for example in examples]
             await asyncio.gather(*tasks)
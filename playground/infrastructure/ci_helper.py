@@ -59,7 +59,7 @@ class CIHelper:
             lambda example: example.tag.multifile is False, examples))
         set_dataset_path_for_examples(single_file_examples)
         async with GRPCClient() as client:
-            await get_statuses(client, single_file_examples)
+            await get_statuses(client, single_file_examples, client_factory=GRPCClient)
             await self._verify_examples(client, single_file_examples, origin)
 
     async def _verify_examples(self, client: any, examples: List[Example], origin: Origin):
@@ -17,13 +17,19 @@
 Common helper module for CI/CD Steps
 """
 import asyncio
+import io
 import logging
 import os
+import re
+from bisect import bisect_right
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from itertools import accumulate
 from dataclasses import dataclass, fields, field
 import urllib3
 from pathlib import PurePath
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple, Callable, Collection, Iterator
 from api.v1 import api_pb2
 
 from tqdm.asyncio import tqdm
@@ -38,6 +44,32 @@ from api.v1.api_pb2 import SDK_UNSPECIFIED, STATUS_UNSPECIFIED, Sdk, \
 from config import Config, TagFields, PrecompiledExampleType, OptionalTagFields, Dataset, Emulator
 from grpc_client import GRPCClient
 
+# libyaml-backed loader is an order of magnitude faster than the pure Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _YAML_LOADER is yaml.SafeLoader:
+    logging.warning("libyaml is not available, falling back to yaml.SafeLoader")
+
+# beam playground tag is expected to be at the head of the file
+_HEAD_SIZE = 16384
+_TITLE_SENTINEL = Config.BEAM_PLAYGROUND_TITLE.strip().encode("utf-8")
+
+_TAG_PREFIX_RE = re.compile(r"//|#")
+_TITLE_PREFIX_CHARS = "/# \t"
+
+# log all errors of an invalid tag instead of the first one
+_VALIDATE_VERBOSE = os.getenv("BEAM_VALIDATE_VERBOSE", "").lower() in ("1", "true", "yes")
+
+# build outputs and tool directories which never contain examples
+_SKIP_DIRS = frozenset({"build", "node_modules", "__pycache__", "venv", "target"})
+
+_SDK_SUFFIX = {sdk: os.extsep + ext for sdk, ext in Config.SDK_TO_EXTENSION.items()}
+_EXT_TO_SDK = {os.extsep + ext: sdk for ext, sdk in Config.EXTENSION_TO_SDK.items()}
+
+_REQUIRED_TAG_FIELDS = frozenset(
+    f.default
+    for f in fields(TagFields)
+    if f.default not in {o_f.default for o_f in fields(OptionalTagFields)})
+
 # TODO replace with dataclass
 Tag = namedtuple(
     "Tag",
@@ -89,6 +121,103 @@ class ExampleTag:
     """
     tag_as_dict: Dict[str, str]
     tag_as_string: str
+    file_content: str
+
+    @property
+    def newline_count(self) -> int:
+        """
+        Number of lines the tag takes in the file
+        """
+        return self.tag_as_string.count("\n")
+
+
+class ConcurrencyLimiter:
+    """
+    Limit the number of concurrently running tasks
+
+    Unlike asyncio.Semaphore the limit can be changed while tasks are running.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def set_limit(self, limit: int):
+        """
+        Change the limit and wake up waiting tasks if there is room for them
+        """
+        async with self._condition:
+            self._limit = limit
+            self._condition.notify_all()
+
+    async def acquire(self):
+        async with self._condition:
+            while self._active >= self._limit:
+                await self._condition.wait()
+            self._active += 1
+
+    async def release(self):
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+
+class StatusPoller:
+    """
+    Poll statuses of the pipelines in groups
+
+    Pipelines waiting for a status are collected and checked together once
+    per delay instead of each of them sleeping and pinging the backend on
+    its own.
+    """
+
+    def __init__(self, client: GRPCClient, delay: float = Config.PAUSE_DELAY):
+        self._client = client
+        self._delay = delay
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def check_status(self, pipeline_id: str) -> api_pb2.Status:
+        """
+        Return status of the pipeline after the next poll
+
+        Args:
+            pipeline_id: id of the pipeline.
+
+        Returns:
+            Status of the pipeline.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((pipeline_id, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+        return await future
+
+    async def _poll(self):
+        while self._pending:
+            await asyncio.sleep(self._delay)
+            pending, self._pending = self._pending, []
+            statuses = await asyncio.gather(
+                *[self._client.check_status(pipeline_id) for pipeline_id, _ in pending],
+                return_exceptions=True)
+            for (_, future), status in zip(pending, statuses):
+                if future.done():
+                    continue
+                if isinstance(status, BaseException):
+                    future.set_exception(status)
+                else:
+                    future.set_result(status)
 
 
 def _check_no_nested(subdirs: List[str]):
@@ -137,19 +266,39 @@ def find_examples(root_dir: str, subdirs: List[str], supported_categories: List[
     has_error = False
     examples = []
     _check_no_nested(subdirs)
+    suffix = _SDK_SUFFIX[sdk]
+    self_path = os.path.join("infrastructure", "helper.py")
+    candidates = []
     for subdir in subdirs:
         subdir = os.path.join(root_dir, subdir)
         logging.info("subdir: %s", subdir)
-        for root, _, files in os.walk(subdir):
+        for root, dirs, files in os.walk(subdir, followlinks=False):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith(".")]
             for filename in files:
+                if not filename.endswith(suffix):
+                    continue
                 filepath = os.path.join(root, filename)
-                error_during_check_file = _check_file(
-                    examples=examples,
-                    filename=filename,
-                    filepath=filepath,
-                    supported_categories=supported_categories,
-                    sdk=sdk)
-                has_error = has_error or error_during_check_file
+                if filepath.endswith(self_path):
+                    continue
+                candidates.append((filepath, filename))
+    candidates.sort()
+    supported_categories = frozenset(supported_categories)
+
+    def _check_one(candidate):
+        filepath, filename = candidate
+        found = []
+        error_during_check_file = _check_file(
+            examples=found,
+            filename=filename,
+            filepath=filepath,
+            supported_categories=supported_categories)
+        return found, error_during_check_file
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for found, error_during_check_file in executor.map(_check_one, candidates):
+            examples.extend(found)
+            has_error = has_error or error_during_check_file
     if has_error:
         raise ValueError(
             "Some of the beam examples contain beam playground tag with "
@@ -157,14 +306,22 @@ def find_examples(root_dir: str, subdirs: List[str], supported_categories: List[
     return examples
 
 
-async def get_statuses(client: GRPCClient, examples: List[Example], concurrency: int = 10):
+async def get_statuses(client: GRPCClient, examples: List[Example], concurrency: int = 10,
+                       client_factory: Optional[Callable[[], GRPCClient]] = None,
+                       pool_size: Optional[int] = None):
     """
     Receive status and update example.status and example.pipeline_id for
     each example
 
     Args:
+        client: client to send requests to the server.
         examples: beam examples for processing and updating statuses and
         pipeline_id values.
+        concurrency: maximum number of examples processed at the same time.
+        client_factory: creates additional clients for the pool. If it is
+        not set, all requests are sent with the client.
+        pool_size: number of clients to spread the examples between,
+        by default one client per 32 concurrent examples.
     """
     tasks = []
     try:
@@ -172,25 +329,33 @@ async def get_statuses(client: GRPCClient, examples: List[Example], concurrency:
         logging.info("override default concurrency: %d", concurrency)
     except (KeyError, ValueError):
         pass
+    if pool_size is None:
+        pool_size = max(1, concurrency // 32)
 
-    semaphore = asyncio.Semaphore(concurrency)
+    async with AsyncExitStack() as stack:
+        clients = [client]
+        if client_factory is not None:
+            for _ in range(pool_size - 1):
+                clients.append(await stack.enter_async_context(client_factory()))
+        pollers = [StatusPoller(pool_client) for pool_client in clients]
+        limiter = ConcurrencyLimiter(concurrency)
 
-    async def _semaphored_task(example):
-        await semaphore.acquire()
-        try:
-            await _update_example_status(example, client)
-        finally:
-            semaphore.release()
+        async def _semaphored_task(example, index):
+            index %= len(clients)
+            async with limiter:
+                await _update_example_status(example, clients[index], pollers[index])
 
-    for example in examples:
-        tasks.append(_semaphored_task(example))
-    await tqdm.gather(*tasks)
+        for index, example in enumerate(examples):
+            tasks.append(_semaphored_task(example, index))
+        await tqdm.gather(*tasks)
 
 
 def get_tag(filepath) -> Optional[ExampleTag]:
     """
     Parse file by filepath and find beam tag
 
+    Only the head of the file is read unless it contains the tag title.
+
     Args:
         filepath: path of the file
 
@@ -198,38 +363,129 @@ def get_tag(filepath) -> Optional[ExampleTag]:
         If file contains tag, returns tag as a map.
         If file doesn't contain tag, returns None
     """
-    add_to_yaml = False
-    yaml_string = ""
-    tag_string = ""
-
-    with open(filepath, encoding="utf-8") as parsed_file:
-        lines = parsed_file.readlines()
-
-    for line in lines:
-        formatted_line = line.replace("//", "").replace("#",
-                                                        "").replace("\t", "    ")
-        if add_to_yaml is False:
-            if formatted_line.lstrip() == Config.BEAM_PLAYGROUND_TITLE:
-                add_to_yaml = True
-                yaml_string += formatted_line.lstrip()
-                tag_string += line
-        else:
-            yaml_with_new_string = yaml_string + formatted_line
-            try:
-                yaml.load(yaml_with_new_string, Loader=yaml.SafeLoader)
-                yaml_string += formatted_line
-                tag_string += line
-            except YAMLError:
-                break
-
-    if add_to_yaml:
-        tag_object = yaml.load(yaml_string, Loader=yaml.SafeLoader)
-        return ExampleTag(tag_object[Config.BEAM_PLAYGROUND], tag_string)
+    # a title starting inside the head may run past it
+    head_size = _HEAD_SIZE + len(_TITLE_SENTINEL)
+    with open(filepath, "rb") as parsed_file:
+        head = parsed_file.read(head_size)
+        if _TITLE_SENTINEL not in head:
+            if len(head) == head_size:
+                logging.debug(
+                    "%s: no beam playground tag in the first %d bytes, "
+                    "the rest of the file is skipped", filepath, head_size)
+            return None
+        data = head + parsed_file.read()
+
+    # decode the same way as a file opened in text mode
+    content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    # split on "\n" only, like readlines() does
+    lines = io.StringIO(content).readlines()
+    title_index = _find_title(lines)
+    if title_index is None:
+        return None
+    tag_end = _find_tag_end(lines, title_index)
+
+    try:
+        tag_object = yaml.load(_get_tag_yaml(lines, title_index, tag_end), Loader=_YAML_LOADER)
+    except YAMLError:
+        tag_end, tag_object = _parse_tag(lines, title_index)
+    tag_string = "".join(lines[title_index:tag_end])
+    return ExampleTag(tag_object[Config.BEAM_PLAYGROUND], tag_string, content)
+
 
+def _find_title(lines: List[str]) -> Optional[int]:
+    """
+    Return index of the line with beam playground title or None
+    """
+    for index, line in enumerate(lines):
+        # endswith doesn't allocate, so most lines are rejected without copying
+        if (line.endswith(Config.BEAM_PLAYGROUND_TITLE) and
+                line.lstrip(_TITLE_PREFIX_CHARS) == Config.BEAM_PLAYGROUND_TITLE):
+            return index
     return None
 
 
-def _check_file(examples, filename, filepath, supported_categories, sdk: Sdk):
+def _find_tag_end(lines: List[str], title_index: int) -> int:
+    """
+    Return index of the first line after the beam tag
+
+    The tag ends at the first non-empty line which is not indented.
+    """
+    for index in range(title_index + 1, len(lines)):
+        formatted_line = _format_tag_line(lines[index])
+        if formatted_line.strip() and not formatted_line[0].isspace():
+            return index
+    return len(lines)
+
+
+def _format_tag_line(line: str) -> str:
+    """
+    Remove comment markers from the line and replace tabs with spaces
+    """
+    return _TAG_PREFIX_RE.sub("", line).replace("\t", "    ")
+
+
+def _parse_tag(lines: List[str], title_index: int) -> Tuple[int, Any]:
+    """
+    Find the end of the beam tag with the yaml parser and parse the tag
+
+    Slow path for tags which can't be detected by the indentation: the rest of
+    the file is parsed as a yaml stream until the first error. The tag ends
+    before the line with the error, after the last parsed value and the blank
+    lines following it. Lines at the end of the tag which are only partly
+    valid are dropped.
+
+    Args:
+        lines: lines of the file.
+        title_index: index of the line with beam playground title.
+
+    Returns:
+        Index of the first line after the beam tag and the parsed tag.
+    """
+    yaml_lines = [Config.BEAM_PLAYGROUND_TITLE]
+    yaml_lines.extend(_format_tag_line(line) for line in lines[title_index + 1:])
+    # yaml marks count \x85 and \u2028 as line breaks, so map them to lines by index
+    line_starts = list(accumulate((len(line) for line in yaml_lines[:-1]), initial=0))
+
+    def _line_of(index: int) -> int:
+        return bisect_right(line_starts, index) - 1
+
+    tag_size = len(yaml_lines)
+    last_index = None
+    try:
+        for event in yaml.parse("".join(yaml_lines), Loader=_YAML_LOADER):
+            # block ends are marked at the next token, which may be out of the tag
+            if event.end_mark.index > event.start_mark.index:
+                last_index = event.end_mark.index
+    except YAMLError as error:
+        mark = getattr(error, "problem_mark", None)
+        position = mark.index if mark is not None else getattr(error, "position", None)
+        if position is not None:
+            tag_size = _line_of(position)
+    if last_index is not None:
+        tag_size = min(tag_size, _line_of(last_index - 1) + 1)
+
+    tag_end = title_index + max(tag_size, 1)
+    while tag_end < len(lines) and not _format_tag_line(lines[tag_end]).strip():
+        tag_end += 1
+    while True:
+        try:
+            return tag_end, yaml.load(
+                _get_tag_yaml(lines, title_index, tag_end), Loader=_YAML_LOADER)
+        except YAMLError:
+            # the title alone is always a valid yaml
+            tag_end -= 1
+
+
+def _get_tag_yaml(lines: List[str], title_index: int, tag_end: int) -> str:
+    """
+    Return the beam tag without comment markers as a yaml string
+    """
+    yaml_parts = [Config.BEAM_PLAYGROUND_TITLE]
+    yaml_parts.extend(_format_tag_line(line) for line in lines[title_index + 1:tag_end])
+    return "".join(yaml_parts)
+
+
+def _check_file(examples, filename, filepath, supported_categories):
     """
     Check file by filepath for matching to beam example. If file is beam example,
     then add it to list of examples
@@ -239,27 +495,21 @@ def _check_file(examples, filename, filepath, supported_categories, sdk: Sdk):
         filename: name of the file.
         filepath: path to the file.
         supported_categories: list of supported categories.
-        sdk: sdk that using to find examples for the specific sdk.
 
     Returns:
         True if file has beam playground tag with incorrect format.
         False if file has correct beam playground tag.
         False if file doesn't contains beam playground tag.
     """
-    if filepath.endswith("infrastructure/helper.py"):
-        return False
-
     has_error = False
-    extension = filepath.split(os.extsep)[-1]
-    if extension == Config.SDK_TO_EXTENSION[sdk]:
-        tag = get_tag(filepath)
-        if tag is not None:
-            if _validate(tag.tag_as_dict, supported_categories) is False:
-                logging.error(
-                    "%s contains beam playground tag with incorrect format", filepath)
-                has_error = True
-            else:
-                examples.append(_get_example(filepath, filename, tag))
+    tag = get_tag(filepath)
+    if tag is not None:
+        if _validate(tag.tag_as_dict, supported_categories) is False:
+            logging.error(
+                "%s contains beam playground tag with incorrect format", filepath)
+            has_error = True
+        else:
+            examples.append(_get_example(filepath, filename, tag))
     return has_error
 
 
@@ -274,7 +524,7 @@ def get_supported_categories(categories_path: str) -> List[str]:
         All supported categories as a list.
     """
     with open(categories_path, encoding="utf-8") as supported_categories:
-        yaml_object = yaml.load(supported_categories.read(), Loader=yaml.SafeLoader)
+        yaml_object = yaml.load(supported_categories.read(), Loader=_YAML_LOADER)
         return yaml_object[TagFields.categories]
 
 def _get_url_vcs(filepath: str):
@@ -300,12 +550,10 @@ def _get_example(filepath: str, filename: str, tag: ExampleTag) -> Example:
     name = tag.tag_as_dict[TagFields.name]
     complexity = tag.tag_as_dict[TagFields.complexity]
     url_notebook = tag.tag_as_dict.get(TagFields.url_notebook)
-    sdk = Config.EXTENSION_TO_SDK[filename.split(os.extsep)[-1]]
+    sdk = _EXT_TO_SDK[os.path.splitext(filename)[1]]
     object_type = _get_object_type(filename, filepath)
-    with open(filepath, encoding="utf-8") as parsed_file:
-        content = parsed_file.read()
-    content = content.replace(tag.tag_as_string, "")
-    tag.tag_as_dict[TagFields.context_line] -= tag.tag_as_string.count("\n")
+    content = tag.file_content.replace(tag.tag_as_string, "")
+    tag.tag_as_dict[TagFields.context_line] -= tag.newline_count
 
     example = Example(
         name=name,
@@ -342,93 +590,109 @@ def _get_example(filepath: str, filename: str, tag: ExampleTag) -> Example:
     return example
 
 
-def _validate(tag: dict, supported_categories: List[str]) -> bool:
+def _validate(tag: dict, supported_categories: Collection[str]) -> bool:
     """
     Validate all tag's fields
 
     Validate that tag contains all required fields and all fields have required
-    format.
+    format. Validation stops at the first error unless BEAM_VALIDATE_VERBOSE
+    is set.
 
     Args:
         tag: beam tag to validate.
-        supported_categories: list of supported categories.
+        supported_categories: supported categories.
 
     Returns:
         In case tag is valid, True
         In case tag is not valid, False
     """
     valid = True
-    required_tag_fields = {
-        f.default
-        for f in fields(TagFields)
-        if f.default not in {o_f.default
-                             for o_f in fields(OptionalTagFields)}
-    }
+    for error in _get_tag_errors(tag, supported_categories):
+        logging.error(*error)
+        valid = False
+        if not _VALIDATE_VERBOSE:
+            break
+    return valid
+
+
+def _get_tag_errors(tag: dict, supported_categories: Collection[str]) -> Iterator[Tuple]:
+    """
+    Check tag's fields one by one and yield an error for each failed check
+
+    Checks run lazily, so the caller can stop after the first error.
+
+    Args:
+        tag: beam tag to validate.
+        supported_categories: supported categories.
+
+    Yields:
+        Errors as logging.error arguments.
+    """
+    if not isinstance(tag, dict):
+        yield "tag should be a mapping, but tag contains: %s", tag
+        return
+
     # check that all fields exist and they have no empty value
-    for field in required_tag_fields:
+    fields_valid = True
+    for field in _REQUIRED_TAG_FIELDS:
         if field not in tag:
-            logging.error(
+            fields_valid = False
+            yield (
                 "tag doesn't contain %s field: %s \n"
                 "Please, check that this field exists in the beam playground tag."
                 "If you are sure that this field exists in the tag"
                 " check the format of indenting.",
                 field,
                 tag)
-            valid = False
-        if valid is True:
+        elif fields_valid:
             value = tag.get(field)
             if (value == "" or value is None) and field != TagFields.pipeline_options:
-                logging.error(
+                fields_valid = False
+                yield (
                     "tag's value is incorrect: %s\n%s field can not be empty.",
                     tag,
                     field)
-                valid = False
 
-    if valid is False:
-        return valid
+    if not fields_valid:
+        return
 
     # check that multifile's value is boolean
     multifile = tag.get(TagFields.multifile)
     if str(multifile).lower() not in ["true", "false"]:
-        logging.error(
+        yield (
             "tag's field multifile is incorrect: %s \n"
             "multifile variable should be boolean format, but tag contains: %s",
             tag,
             multifile)
-        valid = False
 
     # check that categories' value is a list of supported categories
     categories = tag.get(TagFields.categories)
     if not isinstance(categories, list):
-        logging.error(
+        yield (
             "tag's field categories is incorrect: %s \n"
             "categories variable should be list format, but tag contains: %s",
             tag,
             type(categories))
-        valid = False
     else:
         for category in categories:
             if category not in supported_categories:
-                logging.error(
+                yield (
                     "tag contains unsupported category: %s \n"
                     "If you are sure that %s category should be placed in "
                     "Beam Playground, you can add it to the "
                     "`playground/categories.yaml` file",
                     category,
                     category)
-                valid = False
 
     # check that context line's value is integer
     context_line = tag.get(TagFields.context_line)
     if not isinstance(context_line, int):
-        logging.error(
+        yield (
             "Tag's field context_line is incorrect: %s \n"
             "context_line variable should be integer format, "
             "but tag contains: %s",
             tag,
             context_line)
-        valid = False
-    return valid
 
 
 def _get_name(filename: str) -> str:
@@ -446,7 +710,8 @@ def _get_name(filename: str) -> str:
     return filename.split(os.extsep)[0]
 
 
-async def _update_example_status(example: Example, client: GRPCClient):
+async def _update_example_status(example: Example, client: GRPCClient,
+                                 poller: Optional[StatusPoller] = None):
     """
     Receive status for examples and update example.status and pipeline_id
 
@@ -459,7 +724,10 @@ async def _update_example_status(example: Example, client: GRPCClient):
     Args:
         example: beam example for processing and updating status and pipeline_id.
         client: client to send requests to the server.
+        poller: poller shared between examples to check statuses in groups.
     """
+    if poller is None:
+        poller = StatusPoller(client)
     datasets = []
     if example.datasets and example.emulators:
         dataset_tag = example.datasets[0]
@@ -482,8 +750,7 @@ async def _update_example_status(example: Example, client: GRPCClient):
                      STATUS_PREPARING,
                      STATUS_COMPILING,
                      STATUS_EXECUTING]:
-        await asyncio.sleep(Config.PAUSE_DELAY)
-        status = await client.check_status(pipeline_id)
+        status = await poller.check_status(pipeline_id)
     example.status = status
 
 
@@ -498,11 +765,12 @@ def _get_object_type(filename, filepath):
     Returns: type of the object (example, kata, unit-test)
     """
     filename_no_ext = (os.path.splitext(filename)[0]).lower()
+    path_parts = set(filepath.split(os.sep))
     if filename_no_ext.endswith(PrecompiledExampleType.test_ends):
         object_type = PRECOMPILED_OBJECT_TYPE_UNIT_TEST
-    elif PrecompiledExampleType.katas in filepath.split(os.sep):
+    elif PrecompiledExampleType.katas in path_parts:
         object_type = PRECOMPILED_OBJECT_TYPE_KATA
-    elif PrecompiledExampleType.examples in filepath.split(os.sep):
+    elif PrecompiledExampleType.examples in path_parts:
         object_type = PRECOMPILED_OBJECT_TYPE_EXAMPLE
     else:
         object_type = PRECOMPILED_OBJECT_TYPE_UNSPECIFIED
@@ -514,12 +782,13 @@ def validate_examples_for_duplicates_by_name(examples: List[Example]):
     Validate examples for duplicates by example name to avoid duplicates in the Cloud Datastore
     :param examples: examples from the repository for saving to the Cloud Datastore
     """
-    duplicates = {str: Example}
+    duplicates: Dict[str, Example] = {}
     for example in examples:
-        if example.name not in duplicates.keys():
+        duplicate = duplicates.get(example.name)
+        if duplicate is None:
             duplicates[example.name] = example
         else:
-            err_msg = f"Examples have duplicate names.\nDuplicates: \n - path #1: {duplicates[example.name].filepath} \n - path #2: {example.filepath}"
+            err_msg = f"Examples have duplicate names.\nDuplicates: \n - path #1: {duplicate.filepath} \n - path #2: {example.filepath}"
             logging.error(err_msg)
             raise ValidationException(err_msg)
 
@@ -24,6 +24,7 @@ from api.v1.api_pb2 import SDK_JAVA, STATUS_FINISHED, STATUS_ERROR, \
     STATUS_COMPILE_ERROR, STATUS_RUN_ERROR
 from ci_helper import CIHelper, VerifyException
 from config import Origin
+from grpc_client import GRPCClient
 from helper import Example, Tag
 
 
@@ -34,7 +35,7 @@ async def test_verify_examples(mock_get_statuses, mock_verify_examples):
     helper = CIHelper()
     await helper.verify_examples([], Origin.PG_EXAMPLES)
 
-    mock_get_statuses.assert_called_once_with(mock.ANY, [])
+    mock_get_statuses.assert_called_once_with(mock.ANY, [], client_factory=GRPCClient)
     mock_verify_examples.assert_called_once_with(mock.ANY, [], Origin.PG_EXAMPLES)
 
 
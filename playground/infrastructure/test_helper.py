@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 from typing import Dict, Union, List
 from unittest.mock import mock_open
 
@@ -48,6 +49,8 @@ from helper import (
     validate_examples_for_duplicates_by_name,
     ValidationException,
     validate_example_fields,
+    ConcurrencyLimiter,
+    StatusPoller,
 )
 
 
@@ -69,12 +72,13 @@ def test_check_for_nested():
 @mock.patch("helper._check_file")
 @mock.patch("helper.os.walk")
 def test_find_examples(mock_os_walk, mock_check_file, mock_check_no_nested, is_valid):
-    mock_os_walk.return_value = [
-        ("/root/sub1", (), ("file.java",)),
-        ("/root/sub2", (), ("file2.java",)),
+    sub1_dirs = ["dir", "build", ".git"]
+    mock_os_walk.side_effect = [
+        [("/root/sub1", sub1_dirs, ("file.java", "file.go"))],
+        [("/root/sub2", [], ("file2.java",))],
     ]
     mock_check_file.return_value = not is_valid
-    sdk = SDK_UNSPECIFIED
+    sdk = SDK_JAVA
     if is_valid:
         result = find_examples(
             root_dir="/root", subdirs=["sub1", "sub2"], supported_categories=[], sdk=sdk
@@ -91,27 +95,28 @@ def test_find_examples(mock_os_walk, mock_check_file, mock_check_no_nested, is_v
     mock_check_no_nested.assert_called_once_with(["sub1", "sub2"])
     mock_os_walk.assert_has_calls(
         [
-            mock.call("/root/sub1"),
-            mock.call("/root/sub2"),
+            mock.call("/root/sub1", followlinks=False),
+            mock.call("/root/sub2", followlinks=False),
         ]
     )
+    assert sub1_dirs == ["dir"]
+    assert mock_check_file.call_count == 2
     mock_check_file.assert_has_calls(
         [
             mock.call(
                 examples=[],
                 filename="file.java",
                 filepath="/root/sub1/file.java",
-                supported_categories=[],
-                sdk=sdk,
+                supported_categories=frozenset(),
             ),
             mock.call(
                 examples=[],
                 filename="file2.java",
                 filepath="/root/sub2/file2.java",
-                supported_categories=[],
-                sdk=sdk,
+                supported_categories=frozenset(),
             ),
-        ]
+        ],
+        any_order=True,
     )
 
 
@@ -133,21 +138,170 @@ async def test_get_statuses(mock_update_example_status):
     client = mock.sentinel
     await get_statuses(client, [example])
 
-    mock_update_example_status.assert_called_once_with(example, client)
+    mock_update_example_status.assert_called_once_with(example, client, mock.ANY)
+
+
+@pytest.mark.asyncio
+@mock.patch("helper._update_example_status")
+async def test_get_statuses_with_client_pool(mock_update_example_status):
+    examples = [_create_example("MOCK_NAME_1"), _create_example("MOCK_NAME_2")]
+    client = mock.sentinel.client
+    pool_client = mock.MagicMock()
+    pool_client.__aenter__.return_value = pool_client
+
+    await get_statuses(
+        client, examples, client_factory=lambda: pool_client, pool_size=2
+    )
+
+    mock_update_example_status.assert_has_calls(
+        [
+            mock.call(examples[0], client, mock.ANY),
+            mock.call(examples[1], pool_client, mock.ANY),
+        ],
+        any_order=True,
+    )
+    pool_client.__aexit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter():
+    limiter = ConcurrencyLimiter(1)
+    running = 0
+    max_running = 0
+
+    async def _task():
+        nonlocal running, max_running
+        async with limiter:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[_task() for _ in range(4)])
+    assert max_running == 1
+
+    await limiter.set_limit(2)
+    await asyncio.gather(*[_task() for _ in range(4)])
+    assert limiter.limit == 2
+    assert max_running == 2
 
 
 @mock.patch(
     "builtins.open",
-    mock_open(read_data="...\n# beam-playground:\n#     name: Name\n\nimport ..."),
+    mock_open(read_data=b"...\n# beam-playground:\n#     name: Name\n\nimport ..."),
 )
 def test_get_tag_when_tag_is_exists():
     result = get_tag("")
 
     assert result.tag_as_dict.get("name") == "Name"
     assert result.tag_as_string == "# beam-playground:\n#     name: Name\n\n"
+    assert result.file_content == "...\n# beam-playground:\n#     name: Name\n\nimport ..."
+    assert result.newline_count == 3
+
+
+@mock.patch(
+    "builtins.open",
+    mock_open(
+        read_data=b"class Example {\n"
+                  b"    // beam-playground:\n"
+                  b"    //   name: Name\n"
+                  b"    void main() {}\n"
+                  b"}\n"
+    ),
+)
+def test_get_tag_when_tag_is_followed_by_indented_code():
+    result = get_tag("")
+
+    assert result.tag_as_dict == {"name": "Name"}
+    assert result.tag_as_string == "    // beam-playground:\n    //   name: Name\n"
+
+
+@mock.patch(
+    "builtins.open",
+    mock_open(
+        read_data=b"class Example {\n"
+                  b"    // beam-playground:\n"
+                  b"    //   name: Name\n"
+                  b"    //   tags:\n"
+                  b"    //     - tag\n"
+                  b"\n"
+                  b"    @Override\n"
+                  b"    void main() {}\n"
+                  b"}\n"
+    ),
+)
+def test_get_tag_when_tag_is_followed_by_invalid_yaml():
+    result = get_tag("")
+
+    assert result.tag_as_dict == {"name": "Name", "tags": ["tag"]}
+    assert result.tag_as_string == (
+        "    // beam-playground:\n    //   name: Name\n    //   tags:\n    //     - tag\n\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "invalid_line", [b"    //   description: foo: bar\n", b'    //   description: "foo\n']
+)
+def test_get_tag_when_tag_ends_with_partly_valid_line(invalid_line):
+    read_data = (
+        b"class Example {\n"
+        b"    // beam-playground:\n"
+        b"    //   name: Name\n" + invalid_line + b"    void main() {}\n"
+        b"}\n"
+    )
+    with mock.patch("builtins.open", mock_open(read_data=read_data)):
+        result = get_tag("")
+
+    assert result.tag_as_dict == {"name": "Name"}
+    assert result.tag_as_string == "    // beam-playground:\n    //   name: Name\n"
+
+
+@mock.patch("helper._HEAD_SIZE", 32)
+@mock.patch(
+    "builtins.open",
+    mock_open(read_data=b"# beam-playground:\n#   name: Name\n#   complexity: BASIC\n\nimport ..."),
+)
+def test_get_tag_when_tag_is_longer_than_head():
+    result = get_tag("")
 
+    assert result.tag_as_dict == {"name": "Name", "complexity": "BASIC"}
+    assert result.tag_as_string == "# beam-playground:\n#   name: Name\n#   complexity: BASIC\n\n"
 
-@mock.patch("builtins.open", mock_open(read_data="...\n..."))
+
+@mock.patch(
+    "builtins.open",
+    mock_open(read_data=b"// beam-playground:\r\n//   name: Name\r\n\r\npackage main"),
+)
+def test_get_tag_with_windows_line_endings():
+    result = get_tag("")
+
+    assert result.tag_as_dict == {"name": "Name"}
+    assert result.tag_as_string == "// beam-playground:\n//   name: Name\n\n"
+    assert result.file_content == "// beam-playground:\n//   name: Name\n\npackage main"
+
+
+@mock.patch(
+    "builtins.open",
+    mock_open(read_data=b"int x;\x0c// beam-playground:\n//   name: Name\n"),
+)
+def test_get_tag_splits_lines_on_newlines_only():
+    result = get_tag("")
+
+    assert result is None
+
+
+@mock.patch("helper._HEAD_SIZE", 10)
+@mock.patch(
+    "builtins.open",
+    mock_open(read_data=b"int x;\n# beam-playground:\n#   name: Name\n"),
+)
+def test_get_tag_when_title_crosses_head():
+    result = get_tag("")
+
+    assert result.tag_as_dict == {"name": "Name"}
+
+
+@mock.patch("builtins.open", mock_open(read_data=b"...\n..."))
 def test_get_tag_when_tag_does_not_exist():
     result = get_tag("")
 
@@ -158,7 +312,7 @@ def test_get_tag_when_tag_does_not_exist():
 @mock.patch("helper._validate")
 @mock.patch("helper.get_tag")
 def test__check_file_with_correct_tag(mock_get_tag, mock_validate, mock_get_example):
-    tag = ExampleTag({"name": "Name"}, "")
+    tag = ExampleTag({"name": "Name"}, "", "data")
     example = Example(
         name="filename",
         complexity="MEDIUM",
@@ -176,7 +330,7 @@ def test__check_file_with_correct_tag(mock_get_tag, mock_validate, mock_get_exam
     mock_get_example.return_value = example
 
     result = _check_file(
-        examples, "filename.java", "/root/filename.java", [], sdk=SDK_JAVA
+        examples, "filename.java", "/root/filename.java", []
     )
 
     assert result is False
@@ -192,13 +346,12 @@ def test__check_file_with_correct_tag(mock_get_tag, mock_validate, mock_get_exam
 @mock.patch("helper._validate")
 @mock.patch("helper.get_tag")
 def test__check_file_with_incorrect_tag(mock_get_tag, mock_validate):
-    tag = ExampleTag({"name": "Name"}, "")
+    tag = ExampleTag({"name": "Name"}, "", "data")
     examples = []
-    sdk = SDK_JAVA
     mock_get_tag.return_value = tag
     mock_validate.return_value = False
 
-    result = _check_file(examples, "filename.java", "/root/filename.java", [], sdk)
+    result = _check_file(examples, "filename.java", "/root/filename.java", [])
 
     assert result is True
     assert len(examples) == 0
@@ -214,7 +367,6 @@ def test_get_supported_categories():
     assert result[0] == "category"
 
 
-@mock.patch("builtins.open", mock_open(read_data="data"))
 def test__get_example():
     tag = ExampleTag(
         {
@@ -230,6 +382,7 @@ def test__get_example():
             "datasets": {"dataset": {"location": "local", "format": "json"}},
         },
         "",
+        "data",
     )
 
     result = _get_example("../../examples/dir/filepath.java", "filepath.java", tag)
@@ -265,6 +418,16 @@ def test__get_example():
     )
 
 
+def test_example_tag_newline_count():
+    tag = ExampleTag({"name": "Name"}, "// beam-playground:\n//   name: Name\n", "")
+
+    assert tag.newline_count == 2
+
+
+def test__validate_when_tag_is_not_a_mapping():
+    assert _validate(None, []) is False
+
+
 def test__validate_without_name_field():
     tag = {}
     assert _validate(tag, []) is False
@@ -326,6 +489,23 @@ def test__validate_with_all_fields():
     assert _validate(tag, ["category"]) is True
 
 
+@pytest.mark.parametrize("verbose, errors", [(False, 1), (True, 2)])
+def test__validate_logs_errors(caplog, verbose, errors):
+    tag = {
+        "name": "Name",
+        "description": "Description",
+        "multifile": "true",
+        "categories": ["category1"],
+        "context_line": "context_line",
+        "complexity": "MEDIUM",
+        "tags": ["tag"],
+    }
+    with mock.patch("helper._VALIDATE_VERBOSE", verbose):
+        assert _validate(tag, ["category"]) is False
+
+    assert len(caplog.records) == errors
+
+
 def test__get_name():
     result = _get_name("filepath.extension")
 
@@ -368,6 +548,22 @@ async def test__update_example_status(mock_grpc_client_run_code, mock_grpc_clien
     mock_grpc_client_check_status.assert_has_calls([mock.call("pipeline_id")])
 
 
+@pytest.mark.asyncio
+async def test_status_poller_checks_pending_pipelines_together():
+    client = mock.AsyncMock()
+    client.check_status.side_effect = [STATUS_VALIDATING, STATUS_FINISHED]
+    poller = StatusPoller(client, delay=0)
+
+    result = await asyncio.gather(
+        poller.check_status("pipeline_id_1"), poller.check_status("pipeline_id_2")
+    )
+
+    assert result == [STATUS_VALIDATING, STATUS_FINISHED]
+    client.check_status.assert_has_calls(
+        [mock.call("pipeline_id_1"), mock.call("pipeline_id_2")]
+    )
+
+
 def test__get_object_type():
     result_example = _get_object_type(
         "filename.extension", "filepath/examples/filename.extension"
@@ -575,7 +771,7 @@ def _create_example_with_meta(name: str, object_meta: Dict[str, Union[str, bool,
 @mock.patch(
     "builtins.open",
     mock_open(
-        read_data="""
+        read_data=b"""
 
 // beam-playground:
 //   name: KafkaWordCount
@@ -607,6 +803,7 @@ def _create_example_with_meta(name: str, object_meta: Dict[str, Union[str, bool,
 def test_get_tag_with_datasets():
     example = get_tag("filepath")
     example.tag_as_string = ""  # to not compare with itself
+    example.file_content = ""
     assert example == ExampleTag(
         tag_as_dict={
             "name": "KafkaWordCount",
@@ -620,4 +817,5 @@ def test_get_tag_with_datasets():
             "datasets": {"dataset_id_1": {"location": "local", "format": "json"}},
         },
         tag_as_string="",
+        file_content="",
     )